@@ -3,15 +3,328 @@
 file_organizer.py - Pure Python file organization engine
 Organizes files into year-based folders based on creation/modification dates.
 """
+import ctypes
+import errno
 import os
-import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
+
+# shutil drags in tarfile/zipfile and friends at import time; it is only
+# needed for cross-filesystem moves, never on the default dry-run path, so
+# _move_cross_fs imports it on first use instead.
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 from typing import List, Optional, Tuple, Dict, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Linux statx(2) fast path: get_item_year only needs st_mtime, but a full
+# stat() copies the whole struct and may force a metadata sync on network
+# filesystems. statx with AT_STATX_DONT_SYNC | STATX_MTIME fetches just the
+# mtime from the kernel cache. Availability is probed once on first use;
+# anything else falls back to DirEntry.stat().
+_IS_LINUX = sys.platform.startswith('linux')
+
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from <linux/stat.h>; only stx_mask and stx_mtime are read,
+    # the rest exists so the buffer has the kernel's expected 256-byte layout.
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("stx_mnt_id", ctypes.c_uint64),
+        ("stx_dio_mem_align", ctypes.c_uint32),
+        ("stx_dio_offset_align", ctypes.c_uint32),
+        ("_spare1", ctypes.c_uint64 * 12),
+    ]
+
+
+_statx_fn = None
+_statx_available: Optional[bool] = None
+
+# Serializes the one-time libc symbol probes (statx, renameat2)
+_libc_probe_lock = threading.Lock()
+
+# renameat2(2) flag: fail with EEXIST instead of replacing the target
+_RENAME_NOREPLACE = 1
+
+_renameat2_fn = None
+_renameat2_available: Optional[bool] = None
+
+
+def _probe_renameat2() -> bool:
+    """Bind libc renameat2() once; called under _libc_probe_lock."""
+    global _renameat2_fn, _renameat2_available
+
+    if _renameat2_available is None:
+        available = False
+        if sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(None, use_errno=True)
+                fn = libc.renameat2  # AttributeError on pre-2.28 glibc
+                fn.argtypes = [
+                    ctypes.c_int, ctypes.c_char_p,
+                    ctypes.c_int, ctypes.c_char_p,
+                    ctypes.c_uint
+                ]
+                fn.restype = ctypes.c_int
+                _renameat2_fn = fn
+                available = True
+            except (OSError, AttributeError):
+                available = False
+        _renameat2_available = available
+    return _renameat2_available
+
+
+def _rename_noreplace(src: str, dst: str) -> bool:
+    """
+    Atomically rename src to dst, refusing to clobber an existing dst.
+
+    Returns True on success, or False when renameat2/RENAME_NOREPLACE is
+    not usable here (non-Linux, old kernel/glibc, unsupported filesystem,
+    cross-device) so the caller can take the stat-probe fallback. Raises
+    FileExistsError when dst already exists.
+    """
+    if _renameat2_available is None:
+        with _libc_probe_lock:
+            _probe_renameat2()
+    if not _renameat2_available:
+        return False
+
+    res = _renameat2_fn(
+        _AT_FDCWD, os.fsencode(src),
+        _AT_FDCWD, os.fsencode(dst),
+        _RENAME_NOREPLACE
+    )
+    if res == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.EEXIST, errno.ENOTEMPTY):
+        raise FileExistsError(err, os.strerror(err), src, None, dst)
+    if err in (errno.EINVAL, errno.ENOSYS, errno.EXDEV):
+        return False
+    raise OSError(err, os.strerror(err), src, None, dst)
+
+# Standard (non-DST) UTC offset, for converting epoch seconds to local
+# calendar days without building a datetime per file
+_LOCAL_TZ_OFFSET = -time.timezone
+
+
+def _year_from_timestamp(timestamp: float) -> int:
+    """
+    Extract the local calendar year from an epoch timestamp with pure
+    integer arithmetic (civil-from-days), avoiding the tz lookup and object
+    allocation of datetime.fromtimestamp for every file.
+
+    Uses the standard offset only, so a file touched within the DST-shift
+    hour around New Year midnight can land in the neighbouring year - an
+    acceptable tradeoff for year-granularity bucketing.
+    """
+    days = (int(timestamp) + _LOCAL_TZ_OFFSET) // 86400 + 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    return yoe + era * 400 + (1 if mp >= 10 else 0)
+
+
+def _probe_statx() -> bool:
+    """Bind libc statx() once; called under _libc_probe_lock."""
+    global _statx_fn, _statx_available
+
+    if _statx_available is None:
+        available = False
+        if sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(None, use_errno=True)
+                fn = libc.statx  # AttributeError on pre-4.11 glibc
+                # Pin the prototype up front; the first call must not race
+                # with ctypes' lazy argument setup on worker threads.
+                fn.argtypes = [
+                    ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                    ctypes.c_uint, ctypes.POINTER(_Statx)
+                ]
+                fn.restype = ctypes.c_int
+                _statx_fn = fn
+                available = True
+            except (OSError, AttributeError):
+                available = False
+        _statx_available = available
+    return _statx_available
+
+
+def _statx_mtime(path: str) -> Optional[float]:
+    """
+    Fetch st_mtime for path via statx(2) without following symlinks.
+
+    Returns the timestamp, or None when statx is unavailable or the call
+    fails (caller falls back to a regular stat).
+    """
+    if _statx_available is None:
+        with _libc_probe_lock:
+            _probe_statx()
+    if not _statx_available:
+        return None
+
+    buf = _Statx()
+    res = _statx_fn(
+        _AT_FDCWD,
+        os.fsencode(path),
+        _AT_STATX_DONT_SYNC | _AT_SYMLINK_NOFOLLOW,
+        _STATX_MTIME,
+        ctypes.byref(buf)
+    )
+    if res != 0 or not buf.stx_mask & _STATX_MTIME:
+        return None
+    return buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9
+
+
+_FICLONE = 0x40049409  # linux/fs.h: clone (reflink) a whole file
+
+
+def _copy_file_inkernel(src: str, dst: str) -> None:
+    """
+    Copy a regular file without pumping its bytes through user space:
+    FICLONE reflink when the filesystem supports it (btrfs/XFS - then the
+    copy is O(1) regardless of size), otherwise a copy_file_range loop.
+
+    Raises OSError when neither path works so the caller can fall back to
+    shutil's read/write copy. A partially written dst is removed.
+    """
+    if fcntl is None or not hasattr(os, 'copy_file_range'):
+        raise OSError(errno.ENOSYS, "in-kernel copy unavailable")
+
+    src_fd = os.open(src, os.O_RDONLY | os.O_NOFOLLOW)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                return
+            except OSError as e:
+                if e.errno not in (
+                    getattr(errno, 'EOPNOTSUPP', 95),
+                    errno.ENOTTY, errno.EINVAL, errno.EXDEV
+                ):
+                    raise
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    raise OSError(errno.EIO, "short copy_file_range")
+                remaining -= copied
+        except BaseException:
+            os.close(dst_fd)
+            dst_fd = -1
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+            raise
+        finally:
+            if dst_fd >= 0:
+                os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _bulk_statx_mtimes(paths: List[str]) -> Optional[Dict[str, float]]:
+    """
+    Batch-fetch mtimes for paths through io_uring STATX submissions, so N
+    stat syscalls collapse into ~N/256 ring submissions.
+
+    Requires the optional liburing binding (pip install liburing) and a
+    Linux kernel with io_uring; returns None in every other case so the
+    caller can use the per-item stat path instead.
+    """
+    try:
+        import liburing
+    except ImportError:
+        return None
+
+    results: Dict[str, float] = {}
+    try:
+        ring = liburing.io_uring()
+        if liburing.io_uring_queue_init(256, ring, 0) < 0:
+            return None
+        try:
+            cqe = liburing.io_uring_cqe()
+            for start in range(0, len(paths), 256):
+                batch = paths[start:start + 256]
+                # Keep (path, encoded path, statx buffer) alive until reaped
+                pending = []
+                for path in batch:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    buf = liburing.statx()
+                    raw = os.fsencode(path)
+                    liburing.io_uring_prep_statx(
+                        sqe, _AT_FDCWD, raw,
+                        _AT_STATX_DONT_SYNC | _AT_SYMLINK_NOFOLLOW,
+                        _STATX_MTIME, buf
+                    )
+                    pending.append((path, raw, buf))
+                liburing.io_uring_submit(ring)
+                for _ in pending:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    liburing.io_uring_cqe_seen(ring, cqe)
+                # A failed request leaves its buffer's mask empty; those
+                # paths simply fall back to a regular stat
+                for path, _, buf in pending:
+                    if buf.stx_mask & _STATX_MTIME:
+                        results[path] = (
+                            buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9
+                        )
+        finally:
+            liburing.io_uring_queue_exit(ring)
+    except Exception:
+        # Binding/kernel mismatch - not worth failing the run over
+        return None
+    return results
+
+
+# The organizer's own scripts are never moved
+_SCRIPT_NAMES = frozenset({'org_docs.sh', 'org_docs_gui.py', 'file_organizer.py'})
+
+
 class DuplicateMode(Enum):
     """How to handle duplicate files"""
     INTERACTIVE = "interactive"
@@ -20,7 +333,7 @@ class DuplicateMode(Enum):
     OVERWRITE = "overwrite"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizerStats:
     """Statistics for organization operation"""
     files_moved: int = 0
@@ -30,7 +343,7 @@ class OrganizerStats:
     errors: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizerConfig:
     """Configuration for file organizer"""
     source_dir: Path
@@ -43,12 +356,31 @@ class OrganizerConfig:
     excluded_folders: Optional[List[str]] = None
     target_year: Optional[int] = None
     file_types: Optional[List[str]] = None
+    max_concurrency: int = 1
+    use_io_uring: bool = False
+    # Derived in __post_init__ (slots require declaring them as fields)
+    _file_types_set: Optional[frozenset] = field(init=False, repr=False, default=None)
+    _included_set: Optional[frozenset] = field(init=False, repr=False, default=None)
+    _excluded_set: Optional[frozenset] = field(init=False, repr=False, default=None)
 
     def __post_init__(self):
         """Set target_dir to source_dir if not specified"""
         if self.target_dir is None:
             self.target_dir = self.source_dir
 
+        # Normalized frozenset views for constant-time membership tests in
+        # the per-item filter loop (the list fields stay as the public API)
+        self._file_types_set = (
+            frozenset(ft.lstrip('.').lower() for ft in self.file_types)
+            if self.file_types else None
+        )
+        self._included_set = (
+            frozenset(self.included_folders) if self.included_folders else None
+        )
+        self._excluded_set = (
+            frozenset(self.excluded_folders) if self.excluded_folders else None
+        )
+
 
 class FileOrganizer:
     """
@@ -60,7 +392,8 @@ class FileOrganizer:
         self,
         config: OrganizerConfig,
         log_callback: Optional[Callable[[str, str], None]] = None,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
     ):
         """
         Initialize file organizer.
@@ -69,16 +402,55 @@ class FileOrganizer:
             config: Organizer configuration
             log_callback: Function(message, level) for logging (level: info/success/warning/error)
             progress_callback: Function(current, total) for progress updates
+            cancel_event: Optional externally-owned Event; setting it stops
+                the run between items. Lets callers request cancellation
+                even before this constructor has returned.
         """
         self.config = config
         self.stats = OrganizerStats()
+        # Plain bools for the per-item loops; cheaper than two attribute
+        # hops through self.config each iteration
+        self._verbose = config.verbose
+        self._dry_run = config.dry_run
+        self._pending_log_lines = 0
         self.log_callback = log_callback or self._default_log
         self.progress_callback = progress_callback or self._default_progress
         self._cancelled = False
+        self._cancel_event = cancel_event
+        # Guards stats counters when moves run on a thread pool
+        self._stats_lock = threading.Lock()
+        # Set per-run by organize(): True when source and target share a
+        # filesystem, enabling the os.rename fast path in move_item
+        self._same_fs = False
+        # For log messages: every dest lives under target_dir by
+        # construction, so a string slice replaces Path.relative_to's
+        # segment-by-segment walk. The root directory already ends with
+        # the separator, so only account for it when it is not there.
+        target_str = str(config.target_dir)
+        self._target_prefix_len = len(target_str) + (not target_str.endswith(os.sep))
+        # Per-destination-directory name snapshots used by handle_duplicate's
+        # RENAME branch, so collision probing is in-memory instead of one
+        # exists() stat per candidate name
+        self._dest_names: Dict[str, set] = {}
+        self._dest_names_lock = threading.Lock()
+        # Bind the duplicate handler once; handle_duplicate then dispatches
+        # through a bound method instead of comparing the Enum per collision
+        self._dup_handler = {
+            DuplicateMode.SKIP: self._dup_skip,
+            DuplicateMode.OVERWRITE: self._dup_overwrite,
+            DuplicateMode.RENAME: self._dup_rename,
+        }.get(config.duplicate_mode, self._dup_interactive)
+        # Specialized filter predicate compiled once per config; organize()'s
+        # hot loop calls this instead of should_process_item
+        self._filter = self._compile_filter()
 
     def _default_log(self, message: str, level: str = "info"):
-        """Default logging (print to console)"""
-        print(f"[{level.upper()}] {message}")
+        """Default logging (buffered stdout; print would flush per line)"""
+        sys.stdout.write(f"[{level.upper()}] {message}\n")
+        self._pending_log_lines += 1
+        if self._pending_log_lines >= 64:
+            self._pending_log_lines = 0
+            sys.stdout.flush()
 
     def _default_progress(self, current: int, total: int):
         """Default progress (no-op)"""
@@ -89,6 +461,12 @@ class FileOrganizer:
         self._cancelled = True
         self.log("Operation cancelled by user", "warning")
 
+    def _is_cancelled(self) -> bool:
+        """True when cancel() was called or the external event is set"""
+        return self._cancelled or (
+            self._cancel_event is not None and self._cancel_event.is_set()
+        )
+
     def log(self, message: str, level: str = "info"):
         """Log a message"""
         self.log_callback(message, level)
@@ -97,44 +475,69 @@ class FileOrganizer:
         """Update progress"""
         self.progress_callback(current, total)
 
-    def get_item_year(self, path: Path) -> Optional[int]:
+    def get_item_mtime(self, entry: os.DirEntry) -> Optional[float]:
         """
-        Get year from file/directory modification time (more reliable than creation time).
+        Get modification time for a directory entry.
+
+        Uses modification time (st_mtime) - most reliable across platforms;
+        this matches the bash script behavior and user expectations. Prefers
+        the statx fast path on Linux. Elsewhere DirEntry.stat() serves from
+        the data cached during the directory read: on Windows, os.scandir
+        wraps FindFirstFileExW/FindNextFileW, which already returns mtime
+        and attributes for the whole listing in one walk, so the
+        follow_symlinks=False stat below is satisfied without any further
+        system call.
 
         Args:
-            path: Path to file or directory
+            entry: Directory entry for file or directory
 
         Returns:
-            Year as integer, or None if unable to determine
+            Timestamp as float, or None if unable to determine
         """
         try:
-            # Use modification time (st_mtime) - most reliable across platforms
-            # This matches the bash script behavior and user expectations
-            stat_info = path.stat()
-            timestamp = stat_info.st_mtime
-
-            year = datetime.fromtimestamp(timestamp).year
-            return year if 1900 <= year <= 2100 else None
-
+            timestamp = _statx_mtime(entry.path) if _IS_LINUX else None
+            if timestamp is None:
+                timestamp = entry.stat(follow_symlinks=False).st_mtime
+            return timestamp
         except Exception as e:
-            self.log(f"Could not get year for {path.name}: {str(e)}", "warning")
+            self.log(f"Could not get mtime for {entry.name}: {str(e)}", "warning")
             return None
 
-    def should_process_item(self, item: Path, is_directory: bool = False) -> bool:
+    @staticmethod
+    def _year_from_mtime(mtime: Optional[float]) -> Optional[int]:
+        """Convert a modification timestamp to a plausible year, or None."""
+        if mtime is None:
+            return None
+        year = _year_from_timestamp(mtime)
+        return year if 1900 <= year <= 2100 else None
+
+    def get_item_year(self, entry: os.DirEntry) -> Optional[int]:
+        """
+        Get year from file/directory modification time (more reliable than creation time).
+
+        Args:
+            entry: Directory entry for file or directory
+
+        Returns:
+            Year as integer, or None if unable to determine
+        """
+        return self._year_from_mtime(self.get_item_mtime(entry))
+
+    def should_process_item(self, entry: os.DirEntry, is_directory: bool = False) -> bool:
         """
         Check if item should be processed based on filters.
 
         Args:
-            item: Path to check
-            is_directory: Whether item is a directory
+            entry: Directory entry to check
+            is_directory: Whether item is a directory (prefetched from the entry)
 
         Returns:
             True if should process, False otherwise
         """
-        name = item.name
+        name = entry.name
 
         # Skip script files
-        if name in ['org_docs.sh', 'org_docs_gui.py', 'file_organizer.py']:
+        if name in _SCRIPT_NAMES:
             return False
 
         # Check if directory should be included/excluded
@@ -144,32 +547,91 @@ class FileOrganizer:
                 return False
 
             # Check include list
-            if self.config.included_folders:
-                return name in self.config.included_folders
+            if self.config._included_set is not None:
+                return name in self.config._included_set
 
             # Check exclude list
-            if self.config.excluded_folders and name in self.config.excluded_folders:
+            if self.config._excluded_set is not None and name in self.config._excluded_set:
                 return False
 
-        # Check file type filter
-        if not is_directory and self.config.file_types:
-            ext = item.suffix.lstrip('.')
-            if ext not in self.config.file_types:
+        # Check file type filter (case-insensitive on the extension)
+        if not is_directory and self.config._file_types_set is not None:
+            ext = os.path.splitext(name)[1].lstrip('.').lower()
+            if ext not in self.config._file_types_set:
                 return False
 
-        # Check year filter
-        if self.config.target_year:
-            year = self.get_item_year(item)
-            if year != self.config.target_year:
-                return False
+        # Year filtering happens in organize()'s filter pass, which already
+        # fetches the mtime once per item - doing it here too would stat
+        # every file twice.
 
         return True
 
+    def _compile_filter(self):
+        """
+        Build a filter predicate specialized for this run's configuration.
+
+        The filter options (files_only, included/excluded folders, file
+        types) are fixed for the lifetime of an organizer, so instead of
+        re-testing every config attribute per item, the relevant checks are
+        assembled into source once and exec()'d into a plain function.
+        Cheapest checks come first: pure name tests before the is_dir
+        lookup, which in turn stays cached on the DirEntry.
+
+        Returns:
+            A function taking a DirEntry and returning the entry's is_dir
+            flag when it should be processed, or None to skip it.
+        """
+        cfg = self.config
+        lines = [
+            "def _filter(entry):",
+            "    name = entry.name",
+            "    if name in _SCRIPT_NAMES:",
+            "        return None",
+        ]
+        if cfg.files_only and cfg._file_types_set is not None:
+            # Directories are rejected below anyway, so the extension
+            # filter can run on the name alone before touching is_dir
+            lines += [
+                "    if _splitext(name)[1].lstrip('.').lower() not in _FILE_TYPES:",
+                "        return None",
+            ]
+        lines.append("    is_dir = entry.is_dir(follow_symlinks=False)")
+        lines.append("    if is_dir:")
+        if cfg.files_only:
+            lines.append("        return None")
+        elif cfg._included_set is not None:
+            lines.append("        return True if name in _INCLUDED else None")
+        elif cfg._excluded_set is not None:
+            lines += [
+                "        if name in _EXCLUDED:",
+                "            return None",
+                "        return True",
+            ]
+        else:
+            lines.append("        return True")
+        if cfg._file_types_set is not None and not cfg.files_only:
+            lines += [
+                "    if _splitext(name)[1].lstrip('.').lower() not in _FILE_TYPES:",
+                "        return None",
+            ]
+        lines.append("    return is_dir")
+
+        namespace = {
+            '_SCRIPT_NAMES': _SCRIPT_NAMES,
+            '_FILE_TYPES': cfg._file_types_set,
+            '_INCLUDED': cfg._included_set,
+            '_EXCLUDED': cfg._excluded_set,
+            '_splitext': os.path.splitext,
+        }
+        exec("\n".join(lines), namespace)
+        return namespace['_filter']
+
     def handle_duplicate(
         self,
         src: Path,
         dest: Path,
-        is_directory: bool = False
+        is_directory: bool = False,
+        src_mtime: Optional[float] = None
     ) -> Tuple[bool, Optional[Path]]:
         """
         Handle duplicate file/directory.
@@ -178,6 +640,8 @@ class FileOrganizer:
             src: Source path
             dest: Destination path that already exists
             is_directory: Whether item is a directory
+            src_mtime: Source modification time captured during the filter
+                pass; avoids re-statting src for the rename timestamp
 
         Returns:
             Tuple of (should_move, new_dest_path)
@@ -199,89 +663,232 @@ class FileOrganizer:
 
         self.log(f"Duplicate {item_type}: {dest.name}{size_info}", "warning")
 
-        # Handle based on mode
-        if self.config.duplicate_mode == DuplicateMode.SKIP:
-            self.log(f"Skipping duplicate {item_type}", "info")
+        # Dispatch to the handler bound in __init__ - the mode never changes
+        # mid-run, so there is no point re-comparing the Enum per collision
+        return self._dup_handler(src, dest, item_type, src_mtime)
+
+    def _dup_skip(
+        self,
+        src: Path,
+        dest: Path,
+        item_type: str,
+        src_mtime: Optional[float]
+    ) -> Tuple[bool, Optional[Path]]:
+        """Duplicate handler for DuplicateMode.SKIP."""
+        self.log(f"Skipping duplicate {item_type}", "info")
+        with self._stats_lock:
             self.stats.files_skipped += 1
-            return False, None
+        return False, None
 
-        elif self.config.duplicate_mode == DuplicateMode.OVERWRITE:
-            self.log(f"Overwriting existing {item_type}", "warning")
-            return True, dest
+    def _dup_overwrite(
+        self,
+        src: Path,
+        dest: Path,
+        item_type: str,
+        src_mtime: Optional[float]
+    ) -> Tuple[bool, Optional[Path]]:
+        """Duplicate handler for DuplicateMode.OVERWRITE."""
+        self.log(f"Overwriting existing {item_type}", "warning")
+        return True, dest
 
-        elif self.config.duplicate_mode == DuplicateMode.RENAME:
-            # Generate unique name with timestamp
-            timestamp = datetime.fromtimestamp(src.stat().st_mtime).strftime("%Y%m%d_%H%M%S")
-            stem = dest.stem
-            suffix = dest.suffix
-            new_name = f"{stem}_{timestamp}{suffix}"
-            new_dest = dest.parent / new_name
+    def _dup_rename(
+        self,
+        src: Path,
+        dest: Path,
+        item_type: str,
+        src_mtime: Optional[float]
+    ) -> Tuple[bool, Optional[Path]]:
+        """Duplicate handler for DuplicateMode.RENAME."""
+        # Generate unique name with timestamp. Plain string ops here -
+        # each Path property (.stem/.suffix/.parent) re-parses the path
+        # and allocates a new object.
+        if src_mtime is None:
+            src_mtime = src.stat().st_mtime
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(src_mtime))
+        parent, basename = os.path.split(str(dest))
+        stem, suffix = os.path.splitext(basename)
+
+        # Probe for a free name against a one-time snapshot of the
+        # destination directory instead of stat-ing every candidate
+        with self._dest_names_lock:
+            existing = self._dest_names.get(parent)
+            if existing is None:
+                try:
+                    with os.scandir(parent) as it:
+                        existing = {e.name for e in it}
+                except OSError:
+                    existing = set()
+                self._dest_names[parent] = existing
 
-            # Ensure uniqueness
+            new_name = f"{stem}_{timestamp}{suffix}"
             counter = 1
-            while new_dest.exists():
+            while new_name in existing:
                 new_name = f"{stem}_{timestamp}_{counter}{suffix}"
-                new_dest = dest.parent / new_name
                 counter += 1
+            # Later duplicates must see the name we just claimed
+            existing.add(new_name)
+        new_dest = os.path.join(parent, new_name)
 
-            self.log(f"Renaming to: {new_dest.name}", "info")
+        self.log(f"Renaming to: {new_name}", "info")
+        with self._stats_lock:
             self.stats.files_renamed += 1
-            return True, new_dest
+        return True, Path(new_dest)
 
-        # Interactive mode would go here (not implemented for non-blocking operation)
-        else:
-            self.log(f"Skipping duplicate {item_type} (interactive not supported)", "warning")
+    def _dup_interactive(
+        self,
+        src: Path,
+        dest: Path,
+        item_type: str,
+        src_mtime: Optional[float]
+    ) -> Tuple[bool, Optional[Path]]:
+        """Fallback duplicate handler (interactive prompting not supported)."""
+        self.log(f"Skipping duplicate {item_type} (interactive not supported)", "warning")
+        with self._stats_lock:
             self.stats.files_skipped += 1
-            return False, None
+        return False, None
+
+    def _move_cross_fs(self, item: Path, dest: Path, is_directory: bool):
+        """
+        Move item when source and target are on different filesystems.
+
+        Regular files are copied inside the kernel (reflink or
+        copy_file_range) and the source unlinked afterwards; directories,
+        symlinks, and anything the kernel path rejects go through
+        shutil.move's user-space copy.
+        """
+        import shutil  # deferred: unused on dry runs and same-fs renames
+        if not is_directory:
+            try:
+                _copy_file_inkernel(str(item), str(dest))
+            except OSError:
+                shutil.move(str(item), str(dest))
+                return
+            shutil.copystat(str(item), str(dest))
+            os.unlink(str(item))
+        else:
+            shutil.move(str(item), str(dest))
 
     def move_item(
         self,
-        item: Path,
-        is_directory: bool = False
+        entry: os.DirEntry,
+        is_directory: bool = False,
+        year: Optional[int] = None,
+        mtime: Optional[float] = None
     ) -> bool:
         """
         Move file or directory to year-based folder.
 
         Args:
-            item: Path to file or directory
+            entry: Directory entry for file or directory
             is_directory: Whether item is a directory
+            year: Year resolved during the filter pass (looked up here
+                only when not supplied)
+            mtime: Modification time captured during the filter pass,
+                reused when renaming duplicates
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Get year
-            year = self.get_item_year(item)
+            # Get year (normally prefetched by organize)
+            if year is None:
+                if mtime is None:
+                    mtime = self.get_item_mtime(entry)
+                year = self._year_from_mtime(mtime)
             if year is None:
-                self.log(f"Skipping {item.name} (no date)", "warning")
-                self.stats.files_skipped += 1
+                self.log(f"Skipping {entry.name} (no date)", "warning")
+                with self._stats_lock:
+                    self.stats.files_skipped += 1
                 return False
 
             # Create target directory path
             year_dir = self.config.target_dir / str(year)
-            dest = year_dir / item.name
+            dest = year_dir / entry.name
 
             item_type = "directory" if is_directory else "file"
 
-            # Handle duplicates
-            if dest.exists():
-                should_move, new_dest = self.handle_duplicate(item, dest, is_directory)
-                if not should_move:
-                    return False
-                if new_dest:
-                    dest = new_dest
-
-            # Perform move
-            if self.config.dry_run:
-                self.log(f"[DRY-RUN] Would move {item_type}: {item.name} → {dest.relative_to(self.config.target_dir)}", "info")
-            else:
-                # Create year directory
-                year_dir.mkdir(parents=True, exist_ok=True)
-
-                # Move (handles both files and directories)
-                shutil.move(str(item), str(dest))
-                self.log(f"Moved {item_type}: {item.name} → {dest.relative_to(self.config.target_dir)}", "success")
-
+            # Only materialize a Path at the move boundary
+            item = Path(entry.path)
+
+            if self._dry_run:
+                if dest.exists():
+                    should_move, new_dest = self.handle_duplicate(item, dest, is_directory, mtime)
+                    if not should_move:
+                        return False
+                    if new_dest:
+                        dest = new_dest
+                self.log(f"[DRY-RUN] Would move {item_type}: {entry.name} → {str(dest)[self._target_prefix_len:]}", "info")
+                return True
+
+            # Real run (year directories are pre-created in one batch by
+            # organize()). On the same filesystem, try an atomic no-replace
+            # rename first: a collision surfaces as EEXIST, so the common
+            # non-duplicate case skips the dest stat probe entirely.
+            #
+            # A pre-created year directory can vanish mid-run: with
+            # target == source (the default), a year-named folder from a
+            # previous run is itself a scanned item and may get moved away
+            # before the files destined for it. A missing-destination
+            # failure therefore recreates year_dir and retries once.
+            dup_handled = False
+            for attempt in range(2):
+                try:
+                    moved = False
+                    if self._same_fs:
+                        for _ in range(2):
+                            try:
+                                moved = _rename_noreplace(str(item), str(dest))
+                                break
+                            except FileExistsError:
+                                should_move, new_dest = self.handle_duplicate(item, dest, is_directory, mtime)
+                                dup_handled = True
+                                if not should_move:
+                                    return False
+                                if new_dest is None or new_dest == dest:
+                                    # Overwrite mode: replace in place via
+                                    # the plain-rename fallback below
+                                    break
+                                dest = new_dest
+
+                    if not moved:
+                        # Fallback: stat-probe for duplicates, then
+                        # rename/move. Used on non-Linux, cross-filesystem
+                        # runs, and filesystems without RENAME_NOREPLACE
+                        # support.
+                        if not dup_handled and dest.exists():
+                            should_move, new_dest = self.handle_duplicate(item, dest, is_directory, mtime)
+                            dup_handled = True
+                            if not should_move:
+                                return False
+                            if new_dest:
+                                dest = new_dest
+
+                        if self._same_fs:
+                            try:
+                                os.rename(item, dest)
+                            except OSError as e:
+                                if e.errno != errno.EXDEV:
+                                    raise
+                                self._move_cross_fs(item, dest, is_directory)
+                        else:
+                            self._move_cross_fs(item, dest, is_directory)
+                    break
+                except FileNotFoundError:
+                    if attempt:
+                        raise
+                    year_dir.mkdir(parents=True, exist_ok=True)
+
+            # Keep any rename-collision snapshot of this directory current
+            if self._dest_names:
+                parent, basename = os.path.split(str(dest))
+                with self._dest_names_lock:
+                    cached = self._dest_names.get(parent)
+                    if cached is not None:
+                        cached.add(basename)
+
+            self.log(f"Moved {item_type}: {entry.name} → {str(dest)[self._target_prefix_len:]}", "success")
+
+            with self._stats_lock:
                 if is_directory:
                     self.stats.dirs_moved += 1
                 else:
@@ -290,8 +897,9 @@ class FileOrganizer:
             return True
 
         except Exception as e:
-            self.log(f"Error processing {item.name}: {str(e)}", "error")
-            self.stats.errors += 1
+            self.log(f"Error processing {entry.name}: {str(e)}", "error")
+            with self._stats_lock:
+                self.stats.errors += 1
             return False
 
     def organize(self) -> OrganizerStats:
@@ -310,42 +918,122 @@ class FileOrganizer:
         if self.config.dry_run:
             self.log("DRY RUN MODE - No changes will be made", "warning")
 
-        # Collect items to process
+        # Decide the rename fast path once per run: when source and target
+        # live on the same filesystem (the default, since target_dir falls
+        # back to source_dir), move_item can use a direct os.rename.
+        self._same_fs = False
+        if not self.config.dry_run:
+            try:
+                self._same_fs = (
+                    os.stat(self.config.source_dir).st_dev
+                    == os.stat(self.config.target_dir).st_dev
+                )
+            except OSError:
+                # Target may not exist yet; shutil.move handles that path
+                pass
+
+        # Collect items to process. os.scandir returns DirEntry objects whose
+        # is_dir()/stat() results come cached from the directory read, so the
+        # per-item filter below costs roughly one syscall instead of 3-4.
         try:
-            items = list(self.config.source_dir.iterdir())
+            with os.scandir(self.config.source_dir) as it:
+                entries = list(it)
         except Exception as e:
             self.log(f"Error reading source directory: {str(e)}", "error")
             self.stats.errors += 1
             return self.stats
 
-        # Filter items based on configuration
+        # Optional io_uring prefetch: one batched submission fetches every
+        # mtime up front instead of a stat syscall per item in the loop below
+        mtime_map = None
+        if self.config.use_io_uring:
+            mtime_map = _bulk_statx_mtimes([e.path for e in entries])
+
+        # Filter items based on configuration. The year is resolved once here
+        # and threaded through to move_item, which also lets the year
+        # directories be created in one batch below instead of issuing a
+        # redundant mkdir (EEXIST) per moved item.
         items_to_process = []
-        for item in items:
-            if self._cancelled:
+        years_needed = set()
+        # Compiled at __init__ time for exactly this config: only the
+        # relevant checks exist, cheapest (pure-string) rejections first,
+        # and is_dir is served from the DirEntry's cached d_type without
+        # following symlinks (a symlink is organized as itself, not as its
+        # target, consistent with the NOFOLLOW mtime fetch)
+        item_filter = self._filter
+        for entry in entries:
+            if self._is_cancelled():
                 break
 
-            is_dir = item.is_dir()
-            if self.should_process_item(item, is_dir):
-                items_to_process.append((item, is_dir))
-            elif self.config.verbose:
-                self.log(f"Skipping: {item.name}", "info")
+            is_dir = item_filter(entry)
+            if is_dir is None:
+                if self._verbose:
+                    self.log(f"Skipping: {entry.name}", "info")
+                continue
+
+            mtime = None
+            if mtime_map is not None:
+                mtime = mtime_map.get(entry.path)
+            if mtime is None:
+                mtime = self.get_item_mtime(entry)
+            year = self._year_from_mtime(mtime)
+            if self.config.target_year and year != self.config.target_year:
+                if self._verbose:
+                    self.log(f"Skipping: {entry.name}", "info")
+                continue
+            if year is not None:
+                years_needed.add(year)
+            items_to_process.append((entry, is_dir, year, mtime))
 
         total = len(items_to_process)
         self.log(f"Processing {total} items...", "info")
 
-        # Process items
-        for idx, (item, is_dir) in enumerate(items_to_process, 1):
-            if self._cancelled:
-                self.log("Operation cancelled", "warning")
-                break
+        # Create each needed year directory exactly once
+        if not self.config.dry_run:
+            for year in years_needed:
+                try:
+                    (self.config.target_dir / str(year)).mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    self.log(f"Error creating year directory {year}: {str(e)}", "error")
+                    self.stats.errors += 1
+
+        # Process items. With max_concurrency > 1, moves are dispatched to a
+        # thread pool so per-file I/O latency overlaps (cross-filesystem moves
+        # degrade to copy+unlink and benefit the most). Dry runs do no I/O,
+        # so they always take the serial path.
+        workers = max(1, self.config.max_concurrency)
+        # Report progress at ~0.5% granularity rather than per item; each
+        # callback can cross into GUI machinery
+        progress_step = max(1, total // 200)
+        if workers > 1 and not self._dry_run and total > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.move_item, entry, is_dir, year, mtime)
+                    for entry, is_dir, year, mtime in items_to_process
+                ]
+                for idx, future in enumerate(as_completed(futures), 1):
+                    if self._is_cancelled():
+                        for pending in futures:
+                            pending.cancel()
+                        self.log("Operation cancelled", "warning")
+                        break
+                    future.result()
+                    if idx % progress_step == 0 or idx == total:
+                        self.update_progress(idx, total)
+        else:
+            for idx, (entry, is_dir, year, mtime) in enumerate(items_to_process, 1):
+                if self._is_cancelled():
+                    self.log("Operation cancelled", "warning")
+                    break
 
-            self.update_progress(idx, total)
+                if idx % progress_step == 0 or idx == total:
+                    self.update_progress(idx, total)
 
-            if self.config.verbose or not self.config.dry_run:
-                item_type = "directory" if is_dir else "file"
-                self.log(f"[{idx}/{total}] Processing {item_type}: {item.name}", "info")
+                if self._verbose:
+                    item_type = "directory" if is_dir else "file"
+                    self.log(f"[{idx}/{total}] Processing {item_type}: {entry.name}", "info")
 
-            self.move_item(item, is_dir)
+                self.move_item(entry, is_dir, year, mtime)
 
         # Print summary
         self.log("=" * 60, "info")
@@ -368,4 +1056,8 @@ class FileOrganizer:
         if self.config.dry_run:
             self.log("This was a dry run. Uncheck 'Dry Run' to apply changes.", "warning")
 
+        # Drain anything the buffered default logger is still holding
+        self._pending_log_lines = 0
+        sys.stdout.flush()
+
         return self.stats
@@ -16,7 +16,7 @@ try {
     Write-Host "✓ Found: $pythonVersion" -ForegroundColor Green
 } catch {
     Write-Host "✗ Python not found!" -ForegroundColor Red
-    Write-Host "  Install Python 3.8+ from https://www.python.org/downloads/" -ForegroundColor Red
+    Write-Host "  Install Python 3.10+ from https://www.python.org/downloads/" -ForegroundColor Red
     Read-Host "Press Enter to exit"
     exit 1
 }
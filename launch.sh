@@ -29,7 +29,7 @@ elif command -v python &> /dev/null; then
     echo -e "${GREEN}✓ Found: $PYTHON_VERSION${NC}"
 else
     echo -e "${RED}✗ Python not found!${NC}"
-    echo -e "${RED}  Install Python 3.8+ from https://www.python.org/downloads/${NC}"
+    echo -e "${RED}  Install Python 3.10+ from https://www.python.org/downloads/${NC}"
     exit 1
 fi
 
@@ -10,7 +10,7 @@
 #   --target-dir PATH     Where to create year folders (default: source dir)
 #   --dry-run             Show what would be done without making changes
 #   --exclude DIR         Exclude directory from processing (can be used multiple times)
-#   --include DIR         Include directory for processing (can be used multiple times)
+#   --include DIR         Include directory for processing (comma-separated list or repeated flag)
 #   --choose-excludes     Interactively select subdirectories to exclude
 #   --choose-includes     Interactively select ONLY subdirectories to process
 #   --interactive         Prompt for each file move (default for duplicates only)
@@ -60,8 +60,8 @@ Options:
     --target-dir PATH    Where to create year folders (default: source directory)
     --dry-run            Show what would be done without making changes
     --files-only         Process only files, skip all subdirectories
-    --exclude DIR        Exclude directory (can be used multiple times)
-    --include DIR        Include directory (can be used multiple times, overrides excludes)
+    --exclude DIR        Exclude directory (comma-separated list or repeated flag)
+    --include DIR        Include directory (comma-separated list or repeated flag, overrides excludes)
     --choose-excludes    Interactively select subdirectories to exclude before processing
     --choose-includes    Interactively select ONLY subdirectories to process (overrides excludes)
     --interactive        Prompt for confirmation before each move
@@ -106,11 +106,15 @@ while [[ $# -gt 0 ]]; do
             shift
             ;;
         --exclude)
-            EXCLUDED_DIRS+=("$2")
+            # Accepts a single directory or a comma-separated list
+            IFS=',' read -r -a _dirs <<< "$2"
+            EXCLUDED_DIRS+=("${_dirs[@]}")
             shift 2
             ;;
         --include)
-            INCLUDED_DIRS+=("$2")
+            # Accepts a single directory or a comma-separated list
+            IFS=',' read -r -a _dirs <<< "$2"
+            INCLUDED_DIRS+=("${_dirs[@]}")
             shift 2
             ;;
         --choose-excludes)
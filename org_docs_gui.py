@@ -5,21 +5,86 @@ Modern PySide6 interface for organizing files into year-based folders.
 Pure Python implementation - no bash dependencies.
 """
 
+import functools
+import itertools
+import operator
+import os
 import sys
 import json
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson  # Optional: single C call instead of the pure-Python encoder
+except ImportError:
+    orjson = None
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QTreeWidget,
-    QTreeWidgetItem, QCheckBox, QTextEdit, QGroupBox, QGridLayout,
+    QTreeWidgetItem, QCheckBox, QPlainTextEdit, QGroupBox, QGridLayout,
     QSplitter, QMessageBox, QProgressBar
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, QThread, QThreadPool, QTimer, Signal
+from PySide6.QtGui import (
+    QBrush, QColor, QFont, QKeySequence, QShortcut, QTextCharFormat,
+    QTextCursor
+)
 
 from file_organizer import FileOrganizer, OrganizerConfig, DuplicateMode
 
+# Resolved once; Path(__file__).parent re-parses the module path each time
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# Fixed style fragments, built once at import instead of inside init_ui
+_CHECKBOX_STYLE = """
+    QCheckBox {
+        spacing: 8px;
+        color: #e0e0e0;
+        font-size: 10pt;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #666;
+        border-radius: 3px;
+        background-color: #2d2d2d;
+    }
+    QCheckBox::indicator:hover {
+        border: 2px solid #4CAF50;
+        background-color: #3d3d3d;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #4CAF50;
+        border: 2px solid #4CAF50;
+    }
+    QCheckBox::indicator:disabled {
+        background-color: #1a1a1a;
+        border-color: #444;
+    }
+"""
+
+_PROGRESS_BAR_STYLE = """
+    QProgressBar {
+        border: 2px solid #555;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _year_of(timestamp: int) -> int:
+    """Year of an integer epoch timestamp, memoized - the tree only shows
+    the year, and sibling folders usually share a handful of them."""
+    return time.localtime(timestamp).tm_year
+
 
 class OrganizerRunner(QThread):
     """Background thread for running file organization"""
@@ -32,6 +97,18 @@ class OrganizerRunner(QThread):
         self.config = config
         self.organizer = None
         self._cancelled = False
+        self._last_progress_emit = 0.0
+        # Owned here so cancellation works even if cancel() lands before
+        # run() has constructed the organizer
+        self._cancel_event = threading.Event()
+
+    def _emit_progress(self, current: int, total: int):
+        """Forward progress, throttled so a fast organizer cannot flood the
+        GUI event loop; the final update always goes through."""
+        now = time.monotonic()
+        if current == total or now - self._last_progress_emit > 0.05:
+            self._last_progress_emit = now
+            self.progress_updated.emit(current, total)
 
     def run(self):
         """Execute file organization"""
@@ -39,7 +116,8 @@ class OrganizerRunner(QThread):
             self.organizer = FileOrganizer(
                 config=self.config,
                 log_callback=self.log_received.emit,
-                progress_callback=self.progress_updated.emit
+                progress_callback=self._emit_progress,
+                cancel_event=self._cancel_event
             )
             stats = self.organizer.organize()
             self.finished.emit(stats)
@@ -49,14 +127,96 @@ class OrganizerRunner(QThread):
 
     def cancel(self):
         """Cancel the running operation"""
+        self._cancel_event.set()
         if self.organizer:
             self.organizer.cancel()
 
 
+class TreeScanner(QThread):
+    """Background thread for scanning the source directory tree"""
+    rows_ready = Signal(list)  # list of (name, year) tuples
+    scan_failed = Signal(str)  # error message
+
+    def __init__(self, source_dir: str):
+        super().__init__()
+        self.source_dir = source_dir
+
+    def run(self):
+        """Scan one level of subdirectories off the GUI thread"""
+        try:
+            with os.scandir(self.source_dir) as it:
+                subdirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+            # Decorate-sort-undecorate: casefold each name exactly once up
+            # front rather than in a key callable dispatched per element
+            pairs = [(e.name.casefold(), e) for e in subdirs]
+            pairs.sort(key=operator.itemgetter(0))
+            subdirs = [e for _, e in pairs]
+
+            rows = []
+            for subdir in subdirs:
+                # DirEntry.stat with follow_symlinks=False is served from
+                # the directory read's cached attributes where the platform
+                # provides them - no extra stat syscall per entry
+                try:
+                    year = _year_of(int(subdir.stat(follow_symlinks=False).st_mtime))
+                except Exception:
+                    year = None
+                rows.append((subdir.name, year))
+
+            self.rows_ready.emit(rows)
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+    # The child preview is decorative; don't enumerate (or render) more
+    # than this many folders for a single expanded node
+    CHILD_PREVIEW_LIMIT = 50
+
+    @classmethod
+    def _scan_children(cls, dirpath: str):
+        """Enumerate up to CHILD_PREVIEW_LIMIT child folders for dirpath.
+
+        Returns (children, has_more) where children is a list of
+        (name, year) tuples. islice stops consuming the scandir iterator
+        after limit+1 entries, so a 100k-file directory never gets fully
+        materialized just to draw a preview.
+        """
+        try:
+            it = os.scandir(dirpath)
+        except Exception:
+            return [], False  # Skip if can't read subdirectories
+
+        with it:
+            dirs_iter = (e for e in it if e.is_dir(follow_symlinks=False))
+            child_dirs = list(itertools.islice(dirs_iter, cls.CHILD_PREVIEW_LIMIT + 1))
+
+        has_more = len(child_dirs) > cls.CHILD_PREVIEW_LIMIT
+        if has_more:
+            child_dirs = child_dirs[:cls.CHILD_PREVIEW_LIMIT]
+        pairs = [(e.name.casefold(), e) for e in child_dirs]
+        pairs.sort(key=operator.itemgetter(0))
+        child_dirs = [e for _, e in pairs]
+
+        children = []
+        for child in child_dirs:
+            try:
+                child_year = _year_of(int(child.stat(follow_symlinks=False).st_mtime))
+            except Exception:
+                child_year = None
+            children.append((child.name, child_year))
+        return children, has_more
+
+
 class OrgDocsGUI(QMainWindow):
     """Main GUI window for file organizer"""
 
-    SETTINGS_FILE = Path(__file__).parent / "org_docs_gui.json"
+    SETTINGS_FILE = _MODULE_DIR / "org_docs_gui.json"
+
+    # Parsed settings dict from the background load, or an error string
+    settings_loaded = Signal(object)
+
+    # Shared brush for de-emphasized rows; passing Qt.gray to
+    # setForeground constructs a fresh QBrush per call
+    _GRAY_BRUSH = QBrush(Qt.gray)
 
     # Color mapping for log levels
     LOG_COLORS = {
@@ -66,13 +226,41 @@ class OrgDocsGUI(QMainWindow):
         'error': '#f44336'
     }
 
+
     def __init__(self):
         super().__init__()
         self.runner_thread = None
+        self.scanner_thread = None
         self.source_dir = str(Path.home())
         self.splitter = None
         self.zoom_level = 1.0
         self.progress_bar = None
+        # QFonts reused across zoom changes; rebuilding them per keypress
+        # invalidates the widgets' layout caches for nothing
+        self._font_cache = {}
+        self._current_pt = 9  # matches the fonts set in init_ui
+
+        # Coalesce bursts of save_settings calls (e.g. holding Ctrl+=)
+        # into one disk write after the burst settles
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._write_settings)
+
+        # Incoming log lines buffer here and flush in one batch per timer
+        # tick (~60 Hz); appending per message floods the UI thread with
+        # HTML parsing and relayout under verbose runs
+        self._log_buf = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(16)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        self._rescan_pending = False
+        self.settings_loaded.connect(self.apply_settings, Qt.QueuedConnection)
+
+        # Checked folder names, maintained by _on_item_changed so Run
+        # doesn't have to sweep the whole tree
+        self._checked_paths = set()
 
         self.init_ui()
         self.setup_shortcuts()
@@ -139,6 +327,11 @@ class OrgDocsGUI(QMainWindow):
         self.tree_widget.setHeaderLabel("Folders")
         self.tree_widget.setAlternatingRowColors(True)
         self.tree_widget.setMinimumHeight(150)  # Ensure tree is visible
+        # All rows are one line of text, so let the view compute layout
+        # from a single row height instead of measuring every item
+        self.tree_widget.setUniformRowHeights(True)
+        self.tree_widget.itemExpanded.connect(self.populate_children)
+        self.tree_widget.itemChanged.connect(self._on_item_changed)
         tree_layout.addWidget(self.tree_widget)
 
         tree_group.setLayout(tree_layout)
@@ -155,36 +348,8 @@ class OrgDocsGUI(QMainWindow):
         self.interactive_cb.setToolTip("Not supported in GUI mode")
         self.verbose_cb = QCheckBox("Verbose")
 
-        # Checkbox styling
-        checkbox_style = """
-            QCheckBox {
-                spacing: 8px;
-                color: #e0e0e0;
-                font-size: 10pt;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #666;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #4CAF50;
-                background-color: #3d3d3d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4CAF50;
-                border: 2px solid #4CAF50;
-            }
-            QCheckBox::indicator:disabled {
-                background-color: #1a1a1a;
-                border-color: #444;
-            }
-        """
-
         for cb in [self.dry_run_cb, self.interactive_cb, self.verbose_cb]:
-            cb.setStyleSheet(checkbox_style)
+            cb.setStyleSheet(_CHECKBOX_STYLE)
 
         options_layout.addWidget(self.dry_run_cb)
         options_layout.addWidget(self.interactive_cb)
@@ -255,26 +420,27 @@ class OrgDocsGUI(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.progress_bar.setTextVisible(True)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #555;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        # Qt fills in %v/%m/%p itself; no per-update f-string needed
+        self.progress_bar.setFormat("%v/%m (%p%)")
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_STYLE)
         log_layout.addWidget(self.progress_bar)
 
         # Log output
-        self.log_output = QTextEdit()
+        # QPlainTextEdit is built for append-only logs: uniform blocks, no
+        # rich-text document machinery per line
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(5000)  # Bound memory
         self.log_output.setFont(QFont("Consolas", 9))
         self.log_output.setStyleSheet("background-color: #1e1e1e; color: #d4d4d4;")
+
+        # One character format per log level; insertText with these skips
+        # Qt's rich-text parser entirely
+        self._log_formats = {}
+        for level, color in self.LOG_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._log_formats[level] = fmt
         log_layout.addWidget(self.log_output)
 
         self.splitter.addWidget(log_widget)
@@ -304,13 +470,29 @@ class OrgDocsGUI(QMainWindow):
         self.zoom_level = 1.0
         self.apply_zoom()
 
+    def _get_font(self, family: str, point_size: int) -> QFont:
+        """Return a cached QFont for (family, point_size)"""
+        key = (family, point_size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = QFont(family, point_size)
+            self._font_cache[key] = font
+        return font
+
     def apply_zoom(self):
         """Apply current zoom level to UI elements"""
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-        self.log_output.setFont(QFont("Consolas", int(9 * self.zoom_level)))
-        self.tree_widget.setFont(QFont("Arial", int(9 * self.zoom_level)))
         self.save_settings()
 
+        # Only touch the widgets when the integer point size actually
+        # changed; setFont triggers a full text-document relayout
+        new_pt = int(9 * self.zoom_level)
+        if new_pt == self._current_pt:
+            return
+        self._current_pt = new_pt
+        self.log_output.setFont(self._get_font("Consolas", new_pt))
+        self.tree_widget.setFont(self._get_font("Arial", new_pt))
+
     def browse_source(self):
         """Browse for source directory"""
         dir_path = QFileDialog.getExistingDirectory(
@@ -334,58 +516,109 @@ class OrgDocsGUI(QMainWindow):
 
     def refresh_tree(self):
         """Refresh the folder tree from source directory"""
-        self.tree_widget.clear()
         source_path = Path(self.source_edit.text())
 
         if not source_path.exists():
+            self.tree_widget.clear()
+            self._checked_paths.clear()
             self.append_log(f"Source directory does not exist: {source_path}", "error")
             return
 
+        # Scanning stats every subdirectory; on a large or network-mounted
+        # source that freezes the UI, so it runs on a background thread
+        # (same pattern as OrganizerRunner) and streams rows back here.
+        if self.scanner_thread and self.scanner_thread.isRunning():
+            # A scan is already in flight; redo it once that one finishes
+            # (the source directory may have changed meanwhile)
+            self._rescan_pending = True
+            return
+
+        self.tree_widget.clear()
+        self._checked_paths.clear()
+        self.scanner_thread = TreeScanner(str(source_path))
+        self.scanner_thread.rows_ready.connect(self.on_tree_rows)
+        self.scanner_thread.scan_failed.connect(self.on_tree_scan_failed)
+        self.scanner_thread.finished.connect(self._maybe_rescan)
+        self.scanner_thread.start()
+
+    def _maybe_rescan(self):
+        """Re-run refresh_tree if a request arrived during the last scan"""
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.refresh_tree()
+
+    def on_tree_rows(self, rows):
+        """Build tree items from scanned (name, year) rows"""
+        items = []
+        for name, year in rows:
+            display_text = f"{name}  [{year}]" if year is not None else name
+
+            item = QTreeWidgetItem([display_text])
+            item.setCheckState(0, Qt.Unchecked)
+            item.setData(0, Qt.UserRole, name)
+
+            # Child folders load lazily on first expand; a placeholder row
+            # keeps the expansion arrow rendered until then
+            item.setData(0, Qt.UserRole + 1, False)
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            item.addChild(QTreeWidgetItem(["Loading…"]))
+
+            items.append(item)
+
+        # One batched insert: per-item addTopLevelItem makes Qt relayout
+        # and repaint after every insertion
+        self.tree_widget.setUpdatesEnabled(False)
+        self.tree_widget.blockSignals(True)
+        self.tree_widget.setSortingEnabled(False)
         try:
-            subdirs = [d for d in source_path.iterdir() if d.is_dir()]
-            subdirs.sort(key=lambda x: x.name.lower())
+            self.tree_widget.addTopLevelItems(items)
+        finally:
+            self.tree_widget.blockSignals(False)
+            self.tree_widget.setUpdatesEnabled(True)
 
-            for subdir in subdirs:
-                # Get directory info
-                try:
-                    stat_info = subdir.stat()
-                    mod_time = datetime.fromtimestamp(stat_info.st_mtime)
-                    year = mod_time.year
-                    file_count = len([f for f in subdir.iterdir() if f.is_file()])
-                    display_text = f"{subdir.name}  [{year}]"
-                except Exception:
-                    display_text = subdir.name
+        self.append_log(
+            f"Loaded {len(rows)} folders from {self.source_edit.text()}", "success"
+        )
 
-                item = QTreeWidgetItem([display_text])
-                item.setCheckState(0, Qt.Unchecked)
-                item.setData(0, Qt.UserRole, subdir.name)
+    def on_tree_scan_failed(self, message: str):
+        """Handle a failed tree scan"""
+        self.append_log(f"Error loading folders: {message}", "error")
 
-                # Add child folders (one level deep for expandability)
-                try:
-                    child_dirs = [d for d in subdir.iterdir() if d.is_dir()]
-                    child_dirs.sort(key=lambda x: x.name.lower())
-
-                    for child_dir in child_dirs:
-                        try:
-                            child_stat = child_dir.stat()
-                            child_mod = datetime.fromtimestamp(child_stat.st_mtime)
-                            child_year = child_mod.year
-                            child_text = f"{child_dir.name}  [{child_year}]"
-                        except Exception:
-                            child_text = child_dir.name
-
-                        child_item = QTreeWidgetItem([child_text])
-                        child_item.setData(0, Qt.UserRole, child_dir.name)
-                        item.addChild(child_item)
-                except Exception:
-                    pass  # Skip if can't read subdirectories
+    def populate_children(self, item):
+        """Scan one level of child folders the first time a node is expanded"""
+        if item.data(0, Qt.UserRole + 1) is not False:
+            return  # Already loaded, or a leaf child node
 
-                self.tree_widget.addTopLevelItem(item)
+        item.setData(0, Qt.UserRole + 1, True)
+        item.takeChildren()  # Drop the "Loading…" placeholder
 
-            self.append_log(f"Loaded {len(subdirs)} folders from {source_path}", "success")
+        folder_name = item.data(0, Qt.UserRole)
+        dirpath = os.path.join(self.source_edit.text(), folder_name)
+        children, has_more = TreeScanner._scan_children(dirpath)
 
-        except Exception as e:
-            self.append_log(f"Error loading folders: {str(e)}", "error")
+        child_items = []
+        for child_name, child_year in children:
+            child_text = (
+                f"{child_name}  [{child_year}]"
+                if child_year is not None else child_name
+            )
+            child_item = QTreeWidgetItem([child_text])
+            child_item.setData(0, Qt.UserRole, child_name)
+            child_items.append(child_item)
+
+        if has_more:
+            more_item = QTreeWidgetItem(["… more folders not shown"])
+            more_item.setForeground(0, self._GRAY_BRUSH)
+            more_item.setFlags(more_item.flags() & ~Qt.ItemIsSelectable)
+            child_items.append(more_item)
+
+        if child_items:
+            item.addChildren(child_items)
+        else:
+            # Nothing underneath after all; let the arrow disappear
+            item.setChildIndicatorPolicy(
+                QTreeWidgetItem.DontShowIndicatorWhenChildless
+            )
 
     def select_all(self):
         """Select all top-level folders"""
@@ -397,15 +630,19 @@ class OrgDocsGUI(QMainWindow):
         for i in range(self.tree_widget.topLevelItemCount()):
             self.tree_widget.topLevelItem(i).setCheckState(0, Qt.Unchecked)
 
+    def _on_item_changed(self, item, column):
+        """Keep the checked-folder set in sync with checkbox toggles"""
+        folder_name = item.data(0, Qt.UserRole)
+        if folder_name is None:
+            return
+        if item.checkState(0) == Qt.Checked:
+            self._checked_paths.add(folder_name)
+        else:
+            self._checked_paths.discard(folder_name)
+
     def get_selected_folders(self):
         """Get list of selected folder names"""
-        selected = []
-        for i in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(i)
-            if item.checkState(0) == Qt.Checked:
-                folder_name = item.data(0, Qt.UserRole)
-                selected.append(folder_name)
-        return selected
+        return sorted(self._checked_paths)
 
     def run_organizer(self):
         """Run the file organizer"""
@@ -447,7 +684,7 @@ class OrgDocsGUI(QMainWindow):
         )
 
         # Clear log and show progress
-        self.log_output.clear()
+        self.clear_log()
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
@@ -465,10 +702,15 @@ class OrgDocsGUI(QMainWindow):
         self.run_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
-        # Start runner thread
+        # Start runner thread; queued connections hand the signals to the
+        # GUI thread's event loop explicitly
         self.runner_thread = OrganizerRunner(config)
-        self.runner_thread.log_received.connect(self.append_log)
-        self.runner_thread.progress_updated.connect(self.update_progress)
+        self.runner_thread.log_received.connect(
+            self.append_log, Qt.QueuedConnection
+        )
+        self.runner_thread.progress_updated.connect(
+            self.update_progress, Qt.QueuedConnection
+        )
         self.runner_thread.finished.connect(self.on_finished)
         self.runner_thread.start()
 
@@ -480,22 +722,37 @@ class OrgDocsGUI(QMainWindow):
             self.append_log("Cancelling operation...", "warning")
 
     def append_log(self, message: str, level: str = "info"):
-        """Append message to log output with color coding"""
-        color = self.LOG_COLORS.get(level, self.LOG_COLORS['info'])
-        html = f"<span style='color: {color};'>{message}</span>"
-        self.log_output.append(html)
+        """Queue a message for the log output with color coding"""
+        self._log_buf.append((level, message))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Insert all buffered log lines in one batch as plain text"""
+        if not self._log_buf:
+            self._log_flush_timer.stop()
+            return
 
-        # Auto-scroll to bottom
-        scrollbar = self.log_output.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        formats = self._log_formats
+        default_fmt = formats['info']
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for level, message in self._log_buf:
+            cursor.insertText(message + "\n", formats.get(level, default_fmt))
+        cursor.endEditBlock()
+        self._log_buf.clear()
+
+        # Auto-scroll once per batch; reading scrollbar.maximum() forces a
+        # layout flush, whereas following the cursor lets Qt do it lazily
+        self.log_output.setTextCursor(cursor)
+        self.log_output.ensureCursorVisible()
 
     def update_progress(self, current: int, total: int):
         """Update progress bar"""
         if total > 0:
             self.progress_bar.setMaximum(total)
             self.progress_bar.setValue(current)
-            percentage = int((current / total) * 100)
-            self.progress_bar.setFormat(f"{current}/{total} ({percentage}%)")
 
     def on_finished(self, stats):
         """Handle organizer completion"""
@@ -514,67 +771,123 @@ class OrgDocsGUI(QMainWindow):
         self.stop_btn.setEnabled(False)
 
     def clear_log(self):
-        """Clear the log output"""
+        """Clear the log output (including any lines still buffered)"""
+        self._log_buf.clear()
         self.log_output.clear()
 
     def load_settings(self):
-        """Load settings from JSON file"""
-        if not self.SETTINGS_FILE.exists():
+        """Load settings from JSON file on a pool thread; even the tiny
+        settings file can block for hundreds of ms on a network-mounted
+        home, and this runs at startup on the GUI thread."""
+        settings_file = self.SETTINGS_FILE
+        emit = self.settings_loaded.emit
+
+        def _read():
+            try:
+                if not settings_file.exists():
+                    return
+                with open(settings_file, 'r') as f:
+                    emit(json.load(f))
+            except Exception as e:
+                emit(f"Warning: Could not load settings: {str(e)}")
+
+        QThreadPool.globalInstance().start(_read)
+
+    def apply_settings(self, settings):
+        """Apply a loaded settings dict (or log the load error string)"""
+        if isinstance(settings, str):
+            self.append_log(settings, "warning")
             return
 
-        try:
-            with open(self.SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
+        if 'source_dir' in settings and settings['source_dir']:
+            source_changed = settings['source_dir'] != self.source_edit.text()
+            self.source_edit.setText(settings['source_dir'])
+            self.source_dir = settings['source_dir']
+            if source_changed:
+                # The startup scan targeted the default source
+                self.refresh_tree()
 
-            if 'source_dir' in settings and settings['source_dir']:
-                self.source_edit.setText(settings['source_dir'])
-                self.source_dir = settings['source_dir']
+        if 'target_dir' in settings:
+            self.target_edit.setText(settings['target_dir'])
 
-            if 'target_dir' in settings:
-                self.target_edit.setText(settings['target_dir'])
+        # Checkboxes (dry_run intentionally NOT restored - always defaults to ON)
+        if 'verbose' in settings:
+            self.verbose_cb.setChecked(settings['verbose'])
 
-            # Checkboxes (dry_run intentionally NOT restored - always defaults to ON)
-            if 'verbose' in settings:
-                self.verbose_cb.setChecked(settings['verbose'])
+        if 'splitter_sizes' in settings and self.splitter:
+            self.splitter.setSizes(settings['splitter_sizes'])
 
-            if 'splitter_sizes' in settings and self.splitter:
-                self.splitter.setSizes(settings['splitter_sizes'])
+        if 'zoom_level' in settings:
+            self.zoom_level = settings['zoom_level']
+            self.apply_zoom()
 
-            if 'zoom_level' in settings:
-                self.zoom_level = settings['zoom_level']
-                self.apply_zoom()
-
-            self.append_log("✓ Settings loaded", "success")
-
-        except Exception as e:
-            self.append_log(f"Warning: Could not load settings: {str(e)}", "warning")
+        self.append_log("✓ Settings loaded", "success")
 
     def save_settings(self):
-        """Save settings to JSON file"""
+        """Schedule a settings write (debounced; see _save_timer)"""
+        self._save_timer.start()
+
+    def _collect_settings(self) -> dict:
+        """Snapshot the current settings (GUI thread only)"""
+        return {
+            'source_dir': self.source_edit.text(),
+            'target_dir': self.target_edit.text(),
+            'verbose': self.verbose_cb.isChecked(),
+            'splitter_sizes': self.splitter.sizes() if self.splitter else [420, 280],
+            'zoom_level': self.zoom_level
+        }
+
+    def _dump_settings(self, settings: dict):
+        """Write a settings snapshot to the JSON file (compact encoding;
+        pretty-printing is only overhead for a machine-read file)"""
+        # Write to a per-thread temp file and rename it into place: the
+        # close-time synchronous write can overlap a debounced pool write,
+        # and two writers sharing one open(..., 'w') could interleave
+        tmp_path = f"{self.SETTINGS_FILE}.{threading.get_ident()}.tmp"
         try:
-            settings = {
-                'source_dir': self.source_edit.text(),
-                'target_dir': self.target_edit.text(),
-                'verbose': self.verbose_cb.isChecked(),
-                'splitter_sizes': self.splitter.sizes() if self.splitter else [420, 280],
-                'zoom_level': self.zoom_level
-            }
-
-            with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
-
+            if orjson is not None:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(settings))
+            else:
+                with open(tmp_path, 'w') as f:
+                    json.dump(settings, f, separators=(',', ':'))
+            os.replace(tmp_path, self.SETTINGS_FILE)
         except Exception as e:
             print(f"Warning: Could not save settings: {str(e)}")
 
+    def _write_settings(self):
+        """Snapshot settings on the GUI thread, write on a pool thread"""
+        settings = self._collect_settings()
+        QThreadPool.globalInstance().start(
+            functools.partial(self._dump_settings, settings)
+        )
+
     def closeEvent(self, event):
         """Save settings when window closes"""
+        # Write immediately and synchronously; a debounced save may still
+        # be pending, and a pool task might not drain before process exit
+        self._save_timer.stop()
+        self._dump_settings(self._collect_settings())
+
+        if self.scanner_thread and self.scanner_thread.isRunning():
+            # Destroying a running QThread aborts the process in Qt 6; a
+            # scan is one readdir level, so just wait it out rather than
+            # deferring the close like the runner below
+            self._rescan_pending = False
+            self.scanner_thread.wait()
+
         if self.runner_thread and self.runner_thread.isRunning():
+            # Don't block the GUI thread waiting for the worker (the old
+            # wait(3000) froze the close for up to 3 s): cancel, visibly
+            # disable the window, and quit once the worker reports back
             self.runner_thread.cancel()
-            if not self.runner_thread.wait(3000):
-                self.runner_thread.terminate()
-                self.runner_thread.wait()
+            self.runner_thread.finished.connect(
+                QApplication.instance().quit, Qt.QueuedConnection
+            )
+            self.setEnabled(False)
+            event.ignore()
+            return
 
-        self.save_settings()
         event.accept()
 
 